@@ -7,15 +7,23 @@ import sys
 import argparse
 from pathlib import Path
 
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Anchored to the start of a line so keys like mypy's python_version don't match
+_VERSION_RE = re.compile(r'^version = "([^"]+)"', re.MULTILINE)
+
+# (file, compiled pattern, replacement template) for every file carrying the version
+_VERSION_FILES = [
+    ('pyproject.toml', re.compile(r'^version = "[^"]+"', re.MULTILINE), 'version = "{version}"'),
+    ('src/awsup/__init__.py', re.compile(r'^__version__ = "[^"]+"', re.MULTILINE), '__version__ = "{version}"'),
+]
+
 
 def get_current_version():
     """Get current version from pyproject.toml"""
-    pyproject_path = Path(__file__).parent.parent / 'pyproject.toml'
-    
-    with open(pyproject_path, 'r') as f:
-        content = f.read()
+    content = (PROJECT_ROOT / 'pyproject.toml').read_text(encoding='utf-8')
     
-    match = re.search(r'version = "([^"]+)"', content)
+    match = _VERSION_RE.search(content)
     if not match:
         raise ValueError("Could not find version in pyproject.toml")
     
@@ -43,26 +51,25 @@ def bump_version(current_version, bump_type):
 
 def update_version_files(new_version):
     """Update version in all relevant files"""
-    files_to_update = [
-        ('pyproject.toml', r'version = "[^"]+"', f'version = "{new_version}"'),
-        ('src/awsup/__init__.py', r'__version__ = "[^"]+"', f'__version__ = "{new_version}"'),
-    ]
-    
-    for file_path, pattern, replacement in files_to_update:
-        full_path = Path(__file__).parent.parent / file_path
+    for file_path, pattern, template in _VERSION_FILES:
+        full_path = PROJECT_ROOT / file_path
         
         if not full_path.exists():
             print(f"Warning: {file_path} not found")
             continue
         
-        with open(full_path, 'r') as f:
-            content = f.read()
+        content = full_path.read_text(encoding='utf-8')
+        updated_content, count = pattern.subn(template.format(version=new_version), content, count=1)
         
-        updated_content = re.sub(pattern, replacement, content)
+        if not count:
+            print(f"Warning: no version found in {file_path}")
+            continue
         
-        with open(full_path, 'w') as f:
-            f.write(updated_content)
+        if updated_content == content:
+            print(f"✅ {file_path} already at {new_version}")
+            continue
         
+        full_path.write_text(updated_content, encoding='utf-8')
         print(f"✅ Updated {file_path}")
 
 
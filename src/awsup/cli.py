@@ -4,6 +4,7 @@ AWS Website Deployer CLI Entry Point
 """
 import sys
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 import click
@@ -121,11 +122,17 @@ def phase1(ctx, domain):
 @cli.command()
 @click.argument('domain')
 @click.option('--website-path', help='Path to website files')
+@click.option('--concurrency', type=click.IntRange(1, 64), help='Number of parallel file uploads (default: 16)')
+@click.option('--force', is_flag=True, help='Re-upload every file, even if unchanged')
 @click.pass_context
-def phase2(ctx, domain, website_path):
+def phase2(ctx, domain, website_path, concurrency, force):
     """Deploy Phase 2: Full deployment"""
     try:
         config = _load_config(ctx, domain)
+        if concurrency:
+            config.upload_concurrency = concurrency
+        if force:
+            config.skip_unchanged_files = False
         deployer = ProductionDeployer(config)
         
         if not deployer.preflight_checks():
@@ -148,11 +155,17 @@ def phase2(ctx, domain, website_path):
 @cli.command()
 @click.argument('domain')
 @click.option('--website-path', help='Path to website files')
+@click.option('--concurrency', type=click.IntRange(1, 64), help='Number of parallel file uploads (default: 16)')
+@click.option('--force', is_flag=True, help='Re-upload every file, even if unchanged')
 @click.pass_context
-def deploy(ctx, domain, website_path):
+def deploy(ctx, domain, website_path, concurrency, force):
     """Deploy both phases (complete deployment)"""
     try:
         config = _load_config(ctx, domain)
+        if concurrency:
+            config.upload_concurrency = concurrency
+        if force:
+            config.skip_unchanged_files = False
         deployer = ProductionDeployer(config)
         
         if not deployer.preflight_checks():
@@ -215,13 +228,23 @@ def invalidate(ctx, domain, paths):
 @cli.command()
 @click.argument('domain')
 @click.option('--phase', type=click.Choice(['1', '2', 'all']), default='all', help='Which phase to cleanup')
-@click.confirmation_option(prompt='This will delete AWS resources. Continue?')
+@click.option('--yes', '-y', is_flag=True, help='Skip the confirmation prompt (for CI)')
 @click.pass_context
-def cleanup(ctx, domain, phase):
+def cleanup(ctx, domain, phase, yes):
     """Cleanup AWS resources"""
+    config = _load_config(ctx, domain)
+    
+    # Setting up the deployer and listing the bucket are read-only, so they
+    # run while the prompt waits; nothing is deleted until it's answered
+    executor = ThreadPoolExecutor(max_workers=1)
+    setup = executor.submit(_prepare_cleanup, config, phase)
+    executor.shutdown(wait=False)
+    
+    if not yes:
+        click.confirm('This will delete AWS resources. Continue?', abort=True)
+    
     try:
-        config = _load_config(ctx, domain)
-        deployer = ProductionDeployer(config)
+        deployer = setup.result()
         
         if phase == '1':
             deployer.deployer.cleanup_phase1()
@@ -235,6 +258,14 @@ def cleanup(ctx, domain, phase):
         sys.exit(1)
 
 
+def _prepare_cleanup(config: DeploymentConfig, phase: str) -> ProductionDeployer:
+    """Create the deployer and start the read-only listing cleanup will need"""
+    deployer = ProductionDeployer(config)
+    if phase != '1':
+        deployer.deployer.prefetch_cleanup()
+    return deployer
+
+
 def _load_config(ctx, domain: str) -> DeploymentConfig:
     """Load configuration from file or create default"""
     config_path = ctx.obj.get('config_path') or f'.aws-deploy-{domain}.json'
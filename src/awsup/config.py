@@ -3,7 +3,8 @@ Configuration management for AWS Website Deployer
 """
 import os
 import json
-from typing import Dict, Optional, Any
+import time
+from typing import Dict, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from datetime import datetime
@@ -21,6 +22,11 @@ class DeploymentConfig:
     # S3 Configuration
     enable_versioning: bool = True
     enable_encryption: bool = True
+    upload_concurrency: int = 16
+    skip_unchanged_files: bool = True
+    # Off by default: the distribution already compresses at the edge (gzip
+    # and Brotli), and it never re-compresses objects stored with an encoding
+    compress_text_assets: bool = False
     
     # CloudFront Configuration
     price_class: str = 'PriceClass_All'
@@ -97,6 +103,10 @@ class DeploymentConfig:
         if self.certificate_validation_timeout < 60:
             errors.append("Certificate validation timeout too low (minimum 60s)")
         
+        # Validate upload concurrency
+        if not 1 <= self.upload_concurrency <= 64:
+            errors.append(f"Invalid upload concurrency: {self.upload_concurrency} (must be 1-64)")
+        
         if errors:
             raise ValueError(f"Configuration validation failed: {'; '.join(errors)}")
 
@@ -104,12 +114,46 @@ class DeploymentConfig:
 class AWSCredentialValidator:
     """Validates AWS credentials and permissions"""
     
+    # The deployer, preflight checks and CloudFront tagging all need the caller
+    # identity; cache it briefly so one deploy makes a single STS call
+    IDENTITY_CACHE_TTL = 60
+    _identity_cache: Dict[Tuple, Tuple[float, Dict[str, Any]]] = {}
+    
     @staticmethod
-    def validate_credentials() -> bool:
+    def _credential_source() -> Tuple:
+        """Identify where boto3 picks up credentials from"""
+        return (
+            os.environ.get('AWS_PROFILE'),
+            os.environ.get('AWS_ACCESS_KEY_ID'),
+            os.environ.get('AWS_SESSION_TOKEN')
+        )
+    
+    @classmethod
+    def get_caller_identity(cls) -> Dict[str, Any]:
+        """Get STS caller identity, cached for IDENTITY_CACHE_TTL seconds"""
+        source = cls._credential_source()
+        cached = cls._identity_cache.get(source)
+        
+        if cached and time.monotonic() - cached[0] < cls.IDENTITY_CACHE_TTL:
+            return cached[1]
+        
+        sts = boto3.client('sts')
+        identity = sts.get_caller_identity()
+        
+        # Only successful lookups are cached
+        cls._identity_cache[source] = (time.monotonic(), identity)
+        return identity
+    
+    @classmethod
+    def clear_cache(cls):
+        """Forget cached caller identities"""
+        cls._identity_cache.clear()
+    
+    @classmethod
+    def validate_credentials(cls) -> bool:
         """Check if AWS credentials are properly configured"""
         try:
-            sts = boto3.client('sts')
-            response = sts.get_caller_identity()
+            response = cls.get_caller_identity()
             return bool(response.get('Account'))
         except Exception:
             return False
@@ -158,12 +202,11 @@ class AWSCredentialValidator:
         
         return permissions
     
-    @staticmethod
-    def get_account_id() -> Optional[str]:
+    @classmethod
+    def get_account_id(cls) -> Optional[str]:
         """Get AWS account ID"""
         try:
-            sts = boto3.client('sts')
-            return sts.get_caller_identity()['Account']
+            return cls.get_caller_identity()['Account']
         except Exception:
             return None
 
@@ -1,13 +1,18 @@
 """
 ACM Manager for SSL certificate operations
 """
-import boto3
 import time
 from typing import Dict, List, Optional, Any
 from botocore.exceptions import ClientError
 from .base import BaseAWSManager
 from ..config import DeploymentConfig
 
+# Certificate statuses that will never turn into ISSUED ('ERROR' is a failed
+# lookup, not a certificate status, so it keeps polling like CloudFront does)
+CERTIFICATE_FAILURE_STATES = frozenset({
+    'FAILED', 'VALIDATION_TIMED_OUT', 'REVOKED', 'EXPIRED', 'INACTIVE', 'NOT_FOUND'
+})
+
 
 class ACMManager(BaseAWSManager):
     """Manages ACM SSL certificates"""
@@ -15,7 +20,7 @@ class ACMManager(BaseAWSManager):
     def __init__(self, config: DeploymentConfig):
         super().__init__(config)
         # ACM must be in us-east-1 for CloudFront
-        self.client = boto3.client('acm', region_name='us-east-1')
+        self.client = self.create_client('acm', region_name='us-east-1')
         self.domain = config.domain
         self.www_domain = f"www.{config.domain}"
     
@@ -174,39 +179,26 @@ class ACMManager(BaseAWSManager):
         try:
             self.logger.info("Waiting for certificate validation (this may take a few minutes)...")
             
-            waiter = self.client.get_waiter('certificate_validated')
-            
-            waiter.wait(
-                CertificateArn=cert_arn,
-                WaiterConfig={
-                    'Delay': 10,
-                    'MaxAttempts': self.config.certificate_validation_timeout // 10
-                }
+            status = self.wait_for_resource(
+                lambda: self.get_certificate_status(cert_arn),
+                success_states={'ISSUED'},
+                failure_states=CERTIFICATE_FAILURE_STATES,
+                timeout=self.config.certificate_validation_timeout
             )
             
+        except Exception as e:
+            self.logger.error(f"Failed to check certificate status: {e}")
+            return False
+        
+        if status == 'ISSUED':
             self.logger.info("Certificate issued successfully!")
             return True
-            
-        except Exception as e:
-            self.logger.warning(f"Certificate validation timeout or error: {e}")
-            # Check if certificate is actually valid despite timeout
-            try:
-                response = self.client.describe_certificate(CertificateArn=cert_arn)
-                status = response['Certificate']['Status']
-                
-                if status == 'ISSUED':
-                    self.logger.info("Certificate is actually valid despite timeout!")
-                    return True
-                elif status == 'PENDING_VALIDATION':
-                    self.logger.error("Certificate still pending validation - cannot proceed")
-                    return False
-                else:
-                    self.logger.error(f"Certificate in unexpected status: {status}")
-                    return False
-                    
-            except Exception as check_error:
-                self.logger.error(f"Failed to check certificate status: {check_error}")
-                return False
+        elif status == 'PENDING_VALIDATION':
+            self.logger.error("Certificate still pending validation - cannot proceed")
+            return False
+        else:
+            self.logger.error(f"Certificate in unexpected status: {status}")
+            return False
     
     def delete_certificate(self, cert_arn: str):
         """Delete ACM certificate"""
@@ -3,12 +3,17 @@ Base manager class with common functionality
 """
 import time
 import logging
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional, Callable, Iterable
+import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from ..config import DeploymentConfig
 
 logger = logging.getLogger(__name__)
 
+# Enough connections for the parallel upload and delete pools to reuse
+DEFAULT_MAX_POOL_CONNECTIONS = 32
+
 
 class BaseAWSManager:
     """Base class for AWS service managers"""
@@ -16,6 +21,38 @@ class BaseAWSManager:
     def __init__(self, config: DeploymentConfig):
         self.config = config
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        
+        # Adaptive retries add client-side rate limiting on throttling errors,
+        # which copes better with bursts of parallel requests than backoff alone
+        self.client_config = Config(
+            retries={'mode': 'adaptive', 'max_attempts': 10},
+            max_pool_connections=max(DEFAULT_MAX_POOL_CONNECTIONS, config.upload_concurrency),
+            tcp_keepalive=True
+        )
+        
+        self._warm_credentials()
+    
+    def _warm_credentials(self):
+        """
+        Resolve credentials on the shared default session up front
+        
+        Every client is created from boto3's default session, so resolving
+        (and for SSO/assume-role, refreshing) credentials once here keeps the
+        first parallel uploads from all blocking on the same lazy lookup.
+        """
+        try:
+            if boto3.DEFAULT_SESSION is None:
+                boto3.setup_default_session()
+            credentials = boto3.DEFAULT_SESSION.get_credentials()
+            if credentials is not None:
+                credentials.get_frozen_credentials()
+        except Exception as e:
+            # Clients resolve credentials themselves on first use anyway
+            self.logger.debug(f"Could not pre-resolve AWS credentials: {e}")
+    
+    def create_client(self, service_name: str, region_name: Optional[str] = None):
+        """Create a boto3 client using the shared client configuration"""
+        return boto3.client(service_name, region_name=region_name, config=self.client_config)
     
     def retry_with_backoff(
         self, 
@@ -80,31 +117,52 @@ class BaseAWSManager:
         pass
     
     def wait_for_resource(
-        self, 
-        waiter_name: str, 
-        waiter_kwargs: Dict[str, Any],
+        self,
+        get_status: Callable[[], str],
+        success_states: Iterable[str],
+        failure_states: Iterable[str] = (),
         timeout: Optional[int] = None,
-        check_interval: int = 30
-    ) -> bool:
+        initial_delay: float = 5,
+        max_delay: float = 30
+    ) -> str:
         """
-        Wait for AWS resource to reach desired state
+        Poll resource status until it reaches a terminal state
+        
+        Unlike boto3 waiters, this returns as soon as the resource enters a
+        failure state instead of polling until the attempt budget runs out.
+        The poll interval starts at initial_delay and backs off to max_delay.
         
         Args:
-            waiter_name: AWS waiter name
-            waiter_kwargs: Arguments for waiter
+            get_status: Function returning the current resource status
+            success_states: Statuses that end the wait successfully
+            failure_states: Statuses that can never become successful
             timeout: Maximum wait time in seconds
-            check_interval: Check interval in seconds
+            initial_delay: First poll interval in seconds
+            max_delay: Longest poll interval in seconds
+        
+        Returns: The terminal status, or the last status seen on timeout
         """
         timeout = timeout or 600  # Default 10 minutes
+        success_states = set(success_states)
+        failure_states = set(failure_states)
         
-        try:
-            # This would be implemented by each service manager
-            # with their specific waiter logic
-            return True
+        deadline = time.monotonic() + timeout
+        delay = initial_delay
         
-        except Exception as e:
-            self.logger.error(f"Wait operation failed: {e}")
-            return False
+        while True:
+            status = get_status()
+            
+            if status in success_states or status in failure_states:
+                return status
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.logger.warning(f"Timed out after {timeout}s waiting, last status: {status}")
+                return status
+            
+            self.logger.debug(f"Status {status}, checking again in {min(delay, remaining):.0f}s")
+            time.sleep(min(delay, remaining))
+            delay = min(max_delay, delay * 1.5)
     
     def validate_resource_exists(self, resource_id: str) -> bool:
         """Check if resource exists (override in subclasses)"""
@@ -1,13 +1,30 @@
 """
 CloudFront Manager for CDN operations
 """
-import boto3
 import json
-import time
+import uuid
 from typing import Dict, List, Optional, Any
+from urllib.parse import quote
 from botocore.exceptions import ClientError
 from .base import BaseAWSManager
-from ..config import DeploymentConfig
+from ..config import DeploymentConfig, AWSCredentialValidator
+
+# AWS managed "CachingOptimized" cache policy
+CACHING_OPTIMIZED_POLICY_ID = '658327ea-f89d-4fab-a63d-7e88639e58f6'
+MINIMUM_PROTOCOL_VERSION = 'TLSv1.2_2021'
+
+# Every invalidation path is billed, so past this many changed files a
+# single '/*' wildcard is cheaper than listing them all
+MAX_INVALIDATION_PATHS = 100
+
+
+def _viewer_certificate(cert_arn: str) -> Dict[str, str]:
+    """Viewer certificate settings shared by create and update"""
+    return {
+        'ACMCertificateArn': cert_arn,
+        'SSLSupportMethod': 'sni-only',
+        'MinimumProtocolVersion': MINIMUM_PROTOCOL_VERSION
+    }
 
 
 class CloudFrontManager(BaseAWSManager):
@@ -15,7 +32,7 @@ class CloudFrontManager(BaseAWSManager):
     
     def __init__(self, config: DeploymentConfig):
         super().__init__(config)
-        self.client = boto3.client('cloudfront')
+        self.client = self.create_client('cloudfront')
         self.domain = config.domain
         self.www_domain = f"www.{config.domain}"
     
@@ -60,7 +77,7 @@ class CloudFrontManager(BaseAWSManager):
             self.logger.info(f"Distribution domain: {distribution_domain}")
             
             # Add tags
-            self.add_tags(distribution_id)
+            self.add_tags(distribution_id, account_id=account_id)
             
             return {
                 'id': distribution_id,
@@ -113,7 +130,7 @@ class CloudFrontManager(BaseAWSManager):
     def _build_distribution_config(self, bucket_name: str, cert_arn: str, oac_id: str) -> Dict:
         """Build CloudFront distribution configuration"""
         return {
-            'CallerReference': f"{self.domain}-{int(time.time())}",
+            'CallerReference': f"{self.domain}-{uuid.uuid4().hex}",
             'Comment': f'Distribution for {self.domain} (Environment: {self.config.environment})',
             'Enabled': True,
             'Origins': {
@@ -140,7 +157,7 @@ class CloudFrontManager(BaseAWSManager):
                     }
                 },
                 'Compress': True,
-                'CachePolicyId': '658327ea-f89d-4fab-a63d-7e88639e58f6',  # Managed-CachingOptimized
+                'CachePolicyId': CACHING_OPTIMIZED_POLICY_ID,
                 'TrustedSigners': {
                     'Enabled': False,
                     'Quantity': 0
@@ -150,11 +167,7 @@ class CloudFrontManager(BaseAWSManager):
                 'Quantity': 2,
                 'Items': [self.domain, self.www_domain]
             },
-            'ViewerCertificate': {
-                'ACMCertificateArn': cert_arn,
-                'SSLSupportMethod': 'sni-only',
-                'MinimumProtocolVersion': 'TLSv1.2_2021'
-            },
+            'ViewerCertificate': _viewer_certificate(cert_arn),
             'CustomErrorResponses': {
                 'Quantity': 2,
                 'Items': [
@@ -250,11 +263,7 @@ class CloudFrontManager(BaseAWSManager):
             # Update certificate if different
             current_cert = config['ViewerCertificate'].get('ACMCertificateArn')
             if current_cert != cert_arn:
-                config['ViewerCertificate'] = {
-                    'ACMCertificateArn': cert_arn,
-                    'SSLSupportMethod': 'sni-only',
-                    'MinimumProtocolVersion': 'TLSv1.2_2021'
-                }
+                config['ViewerCertificate'] = _viewer_certificate(cert_arn)
                 updated = True
                 changes.append("updated SSL certificate")
             
@@ -308,6 +317,22 @@ class CloudFrontManager(BaseAWSManager):
             self.logger.warning(f"Error updating distribution: {e}")
             raise
     
+    @staticmethod
+    def invalidation_paths(s3_keys: List[str]) -> List[str]:
+        """Build invalidation paths for changed S3 objects"""
+        if len(s3_keys) > MAX_INVALIDATION_PATHS:
+            return ['/*']
+        
+        paths = set()
+        for key in s3_keys:
+            paths.add('/' + quote(key))
+            
+            # The root URL is cached separately from the default root object
+            if key == 'index.html':
+                paths.add('/')
+        
+        return sorted(paths)
+    
     def create_invalidation(self, distribution_id: str, paths: List[str] = None) -> str:
         """Create CloudFront cache invalidation"""
         try:
@@ -316,6 +341,11 @@ class CloudFrontManager(BaseAWSManager):
             
             self.logger.info(f"Creating invalidation for paths: {paths}")
             
+            # CloudFront treats a reused CallerReference as the same request, so a
+            # timestamp would silently dedupe two invalidations in the same second.
+            # Generated once so retries of this call stay idempotent.
+            caller_reference = f"invalidation-{uuid.uuid4().hex}"
+            
             def create_invalidation():
                 return self.client.create_invalidation(
                     DistributionId=distribution_id,
@@ -324,7 +354,7 @@ class CloudFrontManager(BaseAWSManager):
                             'Quantity': len(paths),
                             'Items': paths
                         },
-                        'CallerReference': f"invalidation-{int(time.time())}"
+                        'CallerReference': caller_reference
                     }
                 )
             
@@ -398,16 +428,18 @@ class CloudFrontManager(BaseAWSManager):
             
             self.logger.info("Waiting for distribution deployment (this may take 15-20 minutes)...")
             
-            waiter = self.client.get_waiter('distribution_deployed')
-            waiter.wait(
-                Id=distribution_id,
-                WaiterConfig={
-                    'Delay': 30,
-                    'MaxAttempts': timeout // 30
-                }
+            status = self.wait_for_resource(
+                lambda: self.get_distribution_status(distribution_id),
+                success_states={'Deployed'},
+                failure_states={'NOT_FOUND'},
+                timeout=timeout
             )
             
-            self.logger.info("Distribution deployed successfully!")
+            if status == 'Deployed':
+                self.logger.info("Distribution deployed successfully!")
+            else:
+                self.logger.warning(f"Distribution not deployed yet (status: {status})")
+                self.logger.info("Distribution deployment may still be in progress...")
             
         except Exception as e:
             self.logger.warning(f"Distribution deployment timeout or error: {e}")
@@ -441,9 +473,15 @@ class CloudFrontManager(BaseAWSManager):
         """Get distribution status"""
         return self.get_distribution_status(distribution_id)
     
-    def add_tags(self, distribution_id: str, additional_tags: Optional[Dict[str, str]] = None):
+    def add_tags(
+        self,
+        distribution_id: str,
+        additional_tags: Optional[Dict[str, str]] = None,
+        account_id: Optional[str] = None
+    ):
         """Add tags to CloudFront distribution"""
         try:
+            account_id = account_id or self._get_account_id()
             tags = self.config.default_tags.copy()
             tags['Service'] = 'CloudFront'
             
@@ -454,7 +492,7 @@ class CloudFrontManager(BaseAWSManager):
             
             def add_dist_tags():
                 return self.client.tag_resource(
-                    Resource=f"arn:aws:cloudfront::{self._get_account_id()}:distribution/{distribution_id}",
+                    Resource=f"arn:aws:cloudfront::{account_id}:distribution/{distribution_id}",
                     Tags={'Items': tag_list}
                 )
             
@@ -467,8 +505,7 @@ class CloudFrontManager(BaseAWSManager):
     def _get_account_id(self) -> str:
         """Get AWS account ID"""
         try:
-            sts = boto3.client('sts')
-            return sts.get_caller_identity()['Account']
+            return AWSCredentialValidator.get_caller_identity()['Account']
         except Exception as e:
             self.logger.error(f"Failed to get account ID: {e}")
             raise
@@ -504,7 +541,7 @@ class CloudFrontManager(BaseAWSManager):
     def get_distribution_metrics(self, distribution_id: str, start_time, end_time) -> Dict[str, Any]:
         """Get CloudWatch metrics for distribution"""
         try:
-            cloudwatch = boto3.client('cloudwatch', region_name='us-east-1')
+            cloudwatch = self.create_client('cloudwatch', region_name='us-east-1')
             
             metrics = {}
             
@@ -1,8 +1,7 @@
 """
 Route53 Manager for DNS operations
 """
-import boto3
-import time
+import uuid
 from typing import Dict, List, Optional, Tuple, Any
 from botocore.exceptions import ClientError
 from .base import BaseAWSManager
@@ -14,7 +13,7 @@ class Route53Manager(BaseAWSManager):
     
     def __init__(self, config: DeploymentConfig):
         super().__init__(config)
-        self.client = boto3.client('route53')
+        self.client = self.create_client('route53')
         self.domain = config.domain
         self.www_domain = f"www.{config.domain}"
     
@@ -45,10 +44,13 @@ class Route53Manager(BaseAWSManager):
             # Create new hosted zone
             self.logger.info(f"Creating new hosted zone for {self.domain}")
             
+            # Generated once so a retried request can't create a second zone
+            caller_reference = f"{self.domain}-{uuid.uuid4().hex}"
+            
             def create_zone():
                 return self.client.create_hosted_zone(
                     Name=self.domain,
-                    CallerReference=f"{self.domain}-{int(time.time())}",
+                    CallerReference=caller_reference,
                     HostedZoneConfig={
                         'Comment': f'Hosted zone for {self.domain} (Environment: {self.config.environment})',
                         'PrivateZone': False
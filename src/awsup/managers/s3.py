@@ -3,22 +3,109 @@ S3 Manager for bucket operations
 """
 import os
 import json
-import boto3
-from typing import Dict, List, Optional, Any
+import time
+import gzip
+import hashlib
+import mimetypes
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from pathlib import Path
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 from .base import BaseAWSManager
 from ..config import DeploymentConfig
 from ..validators import FileValidator
 
+MB = 1024 * 1024
+
+# Multipart settings for large assets (AWS recommends 8-16 MB parts)
+MULTIPART_THRESHOLD = 8 * MB
+MULTIPART_CHUNKSIZE = 16 * MB
+
+# Upper bound on parallel part uploads within one file (boto3's own default)
+MULTIPART_MAX_CONCURRENCY = 10
+
+# Files below this size are read once and sent with a single PutObject call
+SINGLE_PUT_THRESHOLD = 5 * MB
+
+# DeleteObjects accepts at most 1000 keys per request
+DELETE_BATCH_SIZE = 1000
+DELETE_WORKERS = 4
+
+# Directory uploads log progress every N files or every interval, not per file
+PROGRESS_EVERY_FILES = 50
+PROGRESS_INTERVAL = 0.5
+
+_CONTENT_TYPES = {
+    '.html': 'text/html',
+    '.css': 'text/css',
+    '.js': 'application/javascript',
+    '.json': 'application/json',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.gif': 'image/gif',
+    '.svg': 'image/svg+xml',
+    '.ico': 'image/x-icon',
+    '.txt': 'text/plain',
+    '.xml': 'application/xml',
+    '.pdf': 'application/pdf',
+    '.woff': 'font/woff',
+    '.woff2': 'font/woff2',
+    '.ttf': 'font/ttf',
+    '.eot': 'application/vnd.ms-fontobject'
+}
+
+# Everything else comes from the standard mimetypes database. The platform
+# copy varies and often lacks newer web formats, so register those up front.
+for _mime_type, _extension in (
+    ('application/wasm', '.wasm'),
+    ('application/json', '.map'),
+    ('application/manifest+json', '.webmanifest'),
+    ('text/javascript', '.mjs'),
+    ('image/webp', '.webp'),
+    ('image/avif', '.avif'),
+    ('font/otf', '.otf'),
+    ('video/webm', '.webm'),
+):
+    mimetypes.add_type(_mime_type, _extension)
+
+# Static assets are cached longer than HTML
+_LONG_CACHE_EXTENSIONS = frozenset({
+    '.css', '.js', '.jpg', '.jpeg', '.png', '.gif', '.svg',
+    '.woff', '.woff2', '.ttf', '.eot'
+})
+_SHORT_CACHE_EXTENSIONS = frozenset({'.html', '.htm'})
+
+# Text formats worth storing gzip-compressed (fonts and images are already compressed)
+_COMPRESSIBLE_CONTENT_TYPES = (
+    'text/', 'application/javascript', 'application/json', 'application/manifest+json',
+    'application/xml', 'application/wasm', 'image/svg+xml'
+)
+
 
 class S3Manager(BaseAWSManager):
     """Manages S3 bucket operations"""
     
     def __init__(self, config: DeploymentConfig):
         super().__init__(config)
-        self.client = boto3.client('s3', region_name=config.region)
+        self.client = self.create_client('s3', region_name=config.region)
         self.bucket_name = config.domain
+        self.uploaded_keys: List[str] = []
+        self._prefetched_versions: Optional[Future] = None
+        
+        # Part uploads run inside each file worker, so split the connection pool
+        # between workers instead of letting workers x parts overflow it
+        part_concurrency = self.client_config.max_pool_connections // config.upload_concurrency
+        part_concurrency = max(1, min(MULTIPART_MAX_CONCURRENCY, part_concurrency))
+        self.transfer_config = TransferConfig(
+            multipart_threshold=MULTIPART_THRESHOLD,
+            multipart_chunksize=MULTIPART_CHUNKSIZE,
+            max_concurrency=part_concurrency,
+            use_threads=True
+        )
     
     def create_or_get_bucket(self) -> str:
         """Create or get existing S3 bucket, always updating configuration"""
@@ -126,10 +213,17 @@ class S3Manager(BaseAWSManager):
     def upload_website_files(self, website_path: Optional[str] = None) -> int:
         """
         Upload website files to S3 bucket
+        
+        Files whose size and MD5 match the object already in the bucket are
+        skipped (like `aws s3 sync`); the keys actually uploaded are kept in
+        self.uploaded_keys so callers can invalidate just those paths. Stored
+        headers aren't compared, so re-upload with skip_unchanged_files off
+        (`--force`) after changing the content type or cache mappings.
+        
         Returns: Number of files uploaded
         """
         try:
-            uploaded_count = 0
+            self.uploaded_keys = []
             
             if not website_path:
                 # Use default landing page
@@ -147,88 +241,249 @@ class S3Manager(BaseAWSManager):
             if path_obj.is_file():
                 # Single file upload - rename default template to index.html
                 s3_key = "index.html" if path_obj.name == "default-index.html" else path_obj.name
-                self._upload_single_file(path_obj, s3_key)
-                uploaded_count = 1
+                remote_objects = self._list_remote_objects(prefix=s3_key)
+                if self._upload_single_file(path_obj, s3_key, remote_objects.get(s3_key)):
+                    self.uploaded_keys.append(s3_key)
+                total_count = 1
             else:
                 # Directory upload
-                uploaded_count = self._upload_directory(path_obj)
+                remote_objects = self._list_remote_objects()
+                self.uploaded_keys, total_count = self._upload_directory(path_obj, remote_objects)
+            
+            uploaded_count = len(self.uploaded_keys)
+            skipped_count = total_count - uploaded_count
             
-            self.logger.info(f"Uploaded {uploaded_count} files successfully")
+            if skipped_count:
+                self.logger.info(
+                    f"Uploaded {uploaded_count} files successfully ({skipped_count} unchanged files skipped)"
+                )
+            else:
+                self.logger.info(f"Uploaded {uploaded_count} files successfully")
             return uploaded_count
             
         except Exception as e:
             self.logger.error(f"File upload failed: {e}")
             raise
     
-    def _upload_single_file(self, file_path: Path, s3_key: str):
-        """Upload single file to S3"""
+    def _list_remote_objects(self, prefix: str = '') -> Dict[str, Tuple[int, str]]:
+        """
+        List objects already in the bucket
+        Returns: {key: (size, etag)}, empty if unchanged files shouldn't be skipped
+        """
+        if not self.config.skip_unchanged_files:
+            return {}
+        
+        remote_objects = {}
+        
+        try:
+            paginator = self.client.get_paginator('list_objects_v2')
+            
+            for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+                for obj in page.get('Contents', []):
+                    remote_objects[obj['Key']] = (obj['Size'], obj['ETag'].strip('"'))
+        
+        except ClientError as e:
+            # Not fatal: fall back to uploading everything
+            self.logger.warning(f"Could not list existing objects, uploading all files: {e}")
+            return {}
+        
+        return remote_objects
+    
+    @staticmethod
+    def _is_unchanged(
+        file_path: Path,
+        remote: Optional[Tuple[int, str]],
+        data: Optional[bytes] = None
+    ) -> bool:
+        """Check if a local file (or its already-read contents) matches the object in S3"""
+        if remote is None:
+            return False
+        
+        remote_size, remote_etag = remote
+        
+        # Cheap size check first, hash only when sizes match
+        size = len(data) if data is not None else file_path.stat().st_size
+        if size != remote_size:
+            return False
+        
+        # Multipart ETags ('<md5>-<parts>') aren't a plain MD5, so always re-upload
+        if '-' in remote_etag:
+            return False
+        
+        digest = hashlib.md5()  # nosec - compared against the S3 ETag, not used for security
+        if data is not None:
+            digest.update(data)
+        else:
+            with open(file_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(MB), b''):
+                    digest.update(chunk)
+        
+        return digest.hexdigest() == remote_etag
+    
+    def _compress(self, data: bytes, content_type: str) -> Optional[bytes]:
+        """
+        Gzip text assets once at upload time (opt-in via compress_text_assets)
+        
+        Stored gzip objects are served as-is, so this trades CloudFront's edge
+        Brotli for smaller origin transfers and storage. Only files under
+        SINGLE_PUT_THRESHOLD are compressed.
+        
+        Returns: Compressed bytes, or None if the file should be stored as-is
+        """
+        if not self.config.compress_text_assets:
+            return None
+        
+        if not content_type.startswith(_COMPRESSIBLE_CONTENT_TYPES):
+            return None
+        
+        # mtime=0 keeps the output (and so the ETag) stable for unchanged files
+        compressed = gzip.compress(data, compresslevel=9, mtime=0)
+        
+        # Tiny files can grow once the gzip header is added
+        return compressed if len(compressed) < len(data) else None
+    
+    def _upload_single_file(
+        self,
+        file_path: Path,
+        s3_key: str,
+        remote: Optional[Tuple[int, str]] = None
+    ) -> bool:
+        """
+        Upload single file to S3
+        Returns: False if the file was skipped because it is unchanged
+        """
         content_type = self._get_content_type(file_path.suffix)
+        headers = {
+            'ContentType': content_type,
+            'CacheControl': self._get_cache_control(file_path.suffix)
+        }
         
-        def upload_file():
-            return self.client.upload_file(
-                str(file_path),
-                self.bucket_name,
-                s3_key,
-                ExtraArgs={
-                    'ContentType': content_type,
-                    'CacheControl': self._get_cache_control(file_path.suffix)
-                }
-            )
+        if file_path.stat().st_size < SINGLE_PUT_THRESHOLD:
+            # Small files: read once, reuse the bytes for the change check and the PUT
+            data = file_path.read_bytes()
+            
+            compressed = self._compress(data, content_type)
+            if compressed is not None:
+                data = compressed
+                headers['ContentEncoding'] = 'gzip'
+            
+            if self._is_unchanged(file_path, remote, data):
+                self.logger.debug(f"Unchanged: {s3_key}")
+                return False
+            
+            def upload_file():
+                return self.client.put_object(
+                    Bucket=self.bucket_name,
+                    Key=s3_key,
+                    Body=data,
+                    **headers
+                )
+        else:
+            if self._is_unchanged(file_path, remote):
+                self.logger.debug(f"Unchanged: {s3_key}")
+                return False
+            
+            def upload_file():
+                return self.client.upload_file(
+                    str(file_path),
+                    self.bucket_name,
+                    s3_key,
+                    ExtraArgs=headers,
+                    Config=self.transfer_config
+                )
         
         self.retry_with_backoff(upload_file)
-        self.logger.info(f"Uploaded: {s3_key}")
+        self.logger.debug(f"Uploaded: {s3_key}")
+        return True
     
-    def _upload_directory(self, dir_path: Path) -> int:
-        """Upload directory contents to S3"""
-        uploaded_count = 0
-        
-        for file_path in dir_path.rglob('*'):
-            if file_path.is_file() and not file_path.name.startswith('.'):
-                relative_path = file_path.relative_to(dir_path)
-                s3_key = str(relative_path).replace('\\', '/')  # Windows compatibility
+    def _upload_directory(
+        self,
+        dir_path: Path,
+        remote_objects: Dict[str, Tuple[int, str]]
+    ) -> Tuple[List[str], int]:
+        """
+        Upload directory contents to S3 using a pool of worker threads
+        Returns: (uploaded keys, number of files considered)
+        """
+        uploads = [(Path(path), s3_key) for path, s3_key in self._iter_files(dir_path)]
+        
+        if not uploads:
+            return [], 0
+        
+        # Uploads are bound by request latency, not CPU, so run them concurrently.
+        # boto3 clients are thread-safe, so all workers share self.client.
+        max_workers = min(self.config.upload_concurrency, len(uploads))
+        uploaded_keys = []
+        
+        total = len(uploads)
+        done = 0
+        last_report = time.monotonic()
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self._upload_single_file, file_path, s3_key, remote_objects.get(s3_key)
+                ): s3_key
+                for file_path, s3_key in uploads
+            }
+            
+            for future in as_completed(futures):
+                try:
+                    uploaded = future.result()
+                except Exception as e:
+                    self.logger.error(f"Failed to upload {futures[future]}: {e}")
+                    # Don't start any uploads still queued behind the failure
+                    for pending in futures:
+                        pending.cancel()
+                    raise
+                if uploaded:
+                    uploaded_keys.append(futures[future])
                 
-                self._upload_single_file(file_path, s3_key)
-                uploaded_count += 1
+                # Results are collected on this thread only, so no locking is needed
+                done += 1
+                now = time.monotonic()
+                if done < total and (done % PROGRESS_EVERY_FILES == 0 or now - last_report >= PROGRESS_INTERVAL):
+                    self.logger.info(f"Processed {done}/{total} files ({len(uploaded_keys)} uploaded)")
+                    last_report = now
         
-        return uploaded_count
+        return uploaded_keys, total
+    
+    @staticmethod
+    def _iter_files(root: Path) -> Iterator[Tuple[str, str]]:
+        """
+        Walk a directory tree with os.scandir
+        Yields: (local_path, s3_key) for every non-hidden file
+        """
+        stack = [(str(root), '')]
+        
+        while stack:
+            dir_path, prefix = stack.pop()
+            
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, f"{prefix}{entry.name}/"))
+                    elif entry.is_file() and not entry.name.startswith('.'):
+                        # Keys always use '/', whatever the local separator
+                        yield entry.path, f"{prefix}{entry.name}"
     
     def _get_content_type(self, extension: str) -> str:
         """Get content type based on file extension"""
         ext = extension.lower()
-        
-        content_types = {
-            '.html': 'text/html',
-            '.css': 'text/css',
-            '.js': 'application/javascript',
-            '.json': 'application/json',
-            '.jpg': 'image/jpeg',
-            '.jpeg': 'image/jpeg',
-            '.png': 'image/png',
-            '.gif': 'image/gif',
-            '.svg': 'image/svg+xml',
-            '.ico': 'image/x-icon',
-            '.txt': 'text/plain',
-            '.xml': 'application/xml',
-            '.pdf': 'application/pdf',
-            '.woff': 'font/woff',
-            '.woff2': 'font/woff2',
-            '.ttf': 'font/ttf',
-            '.eot': 'application/vnd.ms-fontobject'
-        }
-        
-        return content_types.get(ext, 'application/octet-stream')
+        return (
+            _CONTENT_TYPES.get(ext)
+            or mimetypes.types_map.get(ext)
+            or 'application/octet-stream'
+        )
     
     def _get_cache_control(self, extension: str) -> str:
         """Get cache control headers based on file type"""
         ext = extension.lower()
         
-        # Cache static assets longer
-        if ext in ['.css', '.js', '.jpg', '.jpeg', '.png', '.gif', '.svg', 
-                   '.woff', '.woff2', '.ttf', '.eot']:
+        if ext in _LONG_CACHE_EXTENSIONS:
             return 'public, max-age=31536000'  # 1 year
         
-        # Cache HTML files shorter
-        if ext in ['.html', '.htm']:
+        if ext in _SHORT_CACHE_EXTENSIONS:
             return 'public, max-age=3600'  # 1 hour
         
         # Default cache
@@ -274,35 +529,7 @@ class S3Manager(BaseAWSManager):
             self.logger.info(f"Deleting S3 bucket: {self.bucket_name}")
             
             # Delete all object versions and delete markers
-            def list_versions():
-                return self.client.list_object_versions(Bucket=self.bucket_name)
-            
-            paginator = self.client.get_paginator('list_object_versions')
-            
-            delete_list = []
-            
-            for page in paginator.paginate(Bucket=self.bucket_name):
-                # Collect all versions and delete markers
-                for version in page.get('Versions', []):
-                    delete_list.append({
-                        'Key': version['Key'],
-                        'VersionId': version['VersionId']
-                    })
-                
-                for marker in page.get('DeleteMarkers', []):
-                    delete_list.append({
-                        'Key': marker['Key'],
-                        'VersionId': marker['VersionId']
-                    })
-                
-                # Delete in batches of 1000 (AWS limit)
-                if len(delete_list) >= 1000:
-                    self._delete_objects_batch(delete_list[:1000])
-                    delete_list = delete_list[1000:]
-            
-            # Delete remaining objects
-            if delete_list:
-                self._delete_objects_batch(delete_list)
+            self.empty_bucket()
             
             # Delete the bucket
             def delete_bucket():
@@ -315,15 +542,90 @@ class S3Manager(BaseAWSManager):
             self.logger.error(f"Failed to delete S3 bucket: {e}")
             raise
     
+    def empty_bucket(self):
+        """Delete every object version and delete marker, keeping the bucket itself"""
+        versions = self._iter_object_versions()
+        pending = deque()
+        
+        # Batches are deleted on worker threads so the next page is listed
+        # while earlier deletes are still in flight
+        with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as executor:
+            for batch in iter(lambda: list(islice(versions, DELETE_BATCH_SIZE)), []):
+                pending.append(executor.submit(self._delete_objects_batch, batch))
+                
+                # Bound memory: wait for the oldest batch once the pipeline is full
+                if len(pending) > DELETE_WORKERS * 2:
+                    pending.popleft().result()
+            
+            while pending:
+                pending.popleft().result()
+    
+    def prefetch_object_versions(self):
+        """
+        Start listing the first page of object versions in the background
+        
+        Listing is read-only, so it can run while the caller waits on a
+        confirmation prompt. The next empty_bucket call starts deleting from
+        this page and lists the rest from where it ends.
+        """
+        executor = ThreadPoolExecutor(max_workers=1)
+        self._prefetched_versions = executor.submit(
+            self.client.list_object_versions, Bucket=self.bucket_name
+        )
+        executor.shutdown(wait=False)
+    
+    def _iter_object_version_pages(self) -> Iterator[Dict[str, Any]]:
+        """Yield list_object_versions pages, starting from a prefetched page if there is one"""
+        paginator = self.client.get_paginator('list_object_versions')
+        prefetched, self._prefetched_versions = self._prefetched_versions, None
+        
+        first_page = None
+        if prefetched is not None:
+            try:
+                first_page = prefetched.result()
+            except ClientError as e:
+                # List again below so errors surface the same way as without prefetching
+                self.logger.debug(f"Prefetched version listing failed: {e}")
+        
+        if first_page is None:
+            yield from paginator.paginate(Bucket=self.bucket_name)
+            return
+        
+        yield first_page
+        
+        if first_page.get('IsTruncated'):
+            markers = {'KeyMarker': first_page['NextKeyMarker']}
+            if first_page.get('NextVersionIdMarker'):
+                markers['VersionIdMarker'] = first_page['NextVersionIdMarker']
+            yield from paginator.paginate(Bucket=self.bucket_name, **markers)
+    
+    def _iter_object_versions(self) -> Iterator[Dict[str, str]]:
+        """Stream every object version and delete marker in the bucket, one page at a time"""
+        for page in self._iter_object_version_pages():
+            for version in page.get('Versions', []):
+                yield {'Key': version['Key'], 'VersionId': version['VersionId']}
+            
+            for marker in page.get('DeleteMarkers', []):
+                yield {'Key': marker['Key'], 'VersionId': marker['VersionId']}
+    
     def _delete_objects_batch(self, delete_list: List[Dict]):
         """Delete batch of objects"""
         def delete_objects():
             return self.client.delete_objects(
                 Bucket=self.bucket_name,
-                Delete={'Objects': delete_list}
+                Delete={'Objects': delete_list, 'Quiet': True}
             )
         
-        self.retry_with_backoff(delete_objects)
+        response = self.retry_with_backoff(delete_objects)
+        
+        # DeleteObjects reports per-key failures in the response body, not as an exception
+        errors = response.get('Errors', [])
+        if errors:
+            first = errors[0]
+            raise ValueError(
+                f"Failed to delete {len(errors)} objects "
+                f"(first: {first.get('Key')}: {first.get('Code')} {first.get('Message')})"
+            )
     
     def add_tags(self, additional_tags: Optional[Dict[str, str]] = None):
         """Add tags to S3 bucket"""
@@ -2,6 +2,8 @@
 Complete Production Deployer with all AWS services
 """
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from typing import Dict, List, Optional, Any
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -26,12 +28,25 @@ class CompleteProductionDeployer:
         self.account_id = AWSCredentialValidator.get_account_id()
         if not self.account_id:
             raise ValueError("Could not determine AWS account ID")
-        
-        # Initialize all managers
-        self.route53_manager = Route53Manager(config)
-        self.s3_manager = S3Manager(config)
-        self.acm_manager = ACMManager(config)
-        self.cloudfront_manager = CloudFrontManager(config)
+    
+    # Managers (and their boto3 clients) are created on first use, so commands
+    # like status or a phase 1 cleanup only pay for the services they touch
+    
+    @cached_property
+    def route53_manager(self) -> Route53Manager:
+        return Route53Manager(self.config)
+    
+    @cached_property
+    def s3_manager(self) -> S3Manager:
+        return S3Manager(self.config)
+    
+    @cached_property
+    def acm_manager(self) -> ACMManager:
+        return ACMManager(self.config)
+    
+    @cached_property
+    def cloudfront_manager(self) -> CloudFrontManager:
+        return CloudFrontManager(self.config)
     
     def preflight_checks(self) -> bool:
         """Run comprehensive preflight checks"""
@@ -152,6 +167,16 @@ class CompleteProductionDeployer:
                 results['distribution_domain'] = distribution_info['domain']
                 progress.update(task4, description="✅ CloudFront distribution ready")
                 
+                # Existing distributions may still cache the old version of changed files.
+                # Invalidate in the background while the remaining steps run.
+                invalidation = None
+                if distribution_info['action'] == 'updated' and self.s3_manager.uploaded_keys:
+                    executor = ThreadPoolExecutor(max_workers=1)
+                    invalidation = executor.submit(
+                        self._invalidate_uploaded_files, progress, distribution_info['id']
+                    )
+                    executor.shutdown(wait=False)
+                
                 # Step 5: Update S3 Bucket Policy
                 task5 = progress.add_task("Updating S3 bucket policy...", total=None)
                 self.s3_manager.update_bucket_policy(distribution_info['id'], self.account_id)
@@ -165,6 +190,9 @@ class CompleteProductionDeployer:
                 )
                 progress.update(task6, description="✅ DNS records created")
                 
+                if invalidation:
+                    invalidation.result()
+                
                 # Save complete state
                 self.state.update({
                     **results,
@@ -188,6 +216,20 @@ class CompleteProductionDeployer:
                 console.print(f"[red]❌ Phase 2 failed: {e}[/red]")
                 raise
     
+    def _invalidate_uploaded_files(self, progress: Progress, distribution_id: str):
+        """Invalidate the CloudFront paths of files uploaded in this deployment"""
+        paths = self.cloudfront_manager.invalidation_paths(self.s3_manager.uploaded_keys)
+        task = progress.add_task(f"Invalidating {len(paths)} cached paths...", total=None)
+        
+        try:
+            self.cloudfront_manager.create_invalidation(distribution_id, paths)
+            progress.update(task, description=f"✅ Invalidated {len(paths)} cached paths")
+        except Exception as e:
+            # Files are already live in S3; stale edge caches shouldn't fail the deployment
+            progress.update(task, description="⚠️ Cache invalidation failed")
+            console.print(f"[yellow]⚠️ Cache invalidation failed: {e}[/yellow]")
+            console.print(f"[yellow]   Run: awsup invalidate {self.config.domain}[/yellow]")
+    
     def cleanup_phase1(self):
         """Cleanup Phase 1 resources (Route53)"""
         console.print(Panel.fit(
@@ -212,6 +254,11 @@ class CompleteProductionDeployer:
             console.print(f"[red]❌ Phase 1 cleanup failed: {e}[/red]")
             raise
     
+    def prefetch_cleanup(self):
+        """Start the read-only listing Phase 2 cleanup needs, e.g. while a prompt is open"""
+        if 'bucket_name' in self.state:
+            self.s3_manager.prefetch_object_versions()
+    
     def cleanup_phase2(self):
         """Cleanup Phase 2 resources (ACM, S3, CloudFront)"""
         console.print(Panel.fit(
@@ -222,13 +269,22 @@ class CompleteProductionDeployer:
         try:
             # Delete in reverse order of creation
             
-            # 1. CloudFront Distribution
-            if 'distribution_id' in self.state:
-                console.print("[yellow]Deleting CloudFront distribution...[/yellow]")
-                self.cloudfront_manager.delete_distribution(self.state['distribution_id'])
+            # 1. CloudFront Distribution. Disabling it takes minutes, so the
+            # bucket's objects are emptied in the background meanwhile; the
+            # bucket itself stays until the distribution no longer uses it
+            bucket_emptying = None
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                if 'bucket_name' in self.state:
+                    console.print("[yellow]Emptying S3 bucket in the background...[/yellow]")
+                    bucket_emptying = executor.submit(self.s3_manager.empty_bucket)
+                
+                if 'distribution_id' in self.state:
+                    console.print("[yellow]Deleting CloudFront distribution...[/yellow]")
+                    self.cloudfront_manager.delete_distribution(self.state['distribution_id'])
             
-            # 2. S3 Bucket
+            # 2. S3 Bucket (lists again, so anything written meanwhile is removed too)
             if 'bucket_name' in self.state:
+                bucket_emptying.result()
                 console.print("[yellow]Deleting S3 bucket and contents...[/yellow]")
                 self.s3_manager.delete_bucket_and_contents()
             
@@ -70,8 +70,10 @@ class FileValidator:
     
     ALLOWED_EXTENSIONS = {
         '.html', '.htm', '.css', '.js', '.json', '.xml', '.txt',
-        '.jpg', '.jpeg', '.png', '.gif', '.svg', '.ico', '.webp',
+        '.mjs', '.map', '.wasm', '.webmanifest',
+        '.jpg', '.jpeg', '.png', '.gif', '.svg', '.ico', '.webp', '.avif',
         '.woff', '.woff2', '.ttf', '.eot', '.otf',
+        '.mp4', '.webm',
         '.pdf', '.zip', '.tar.gz'
     }
     
@@ -83,6 +85,7 @@ class FileValidator:
         r'document\.write',                       # document.write
         r'window\.location',                      # Location manipulation
     ]
+    SECURITY_REGEXES = [re.compile(pattern, re.IGNORECASE) for pattern in SECURITY_PATTERNS]
     
     @classmethod
     def validate_website_path(cls, path: str) -> Tuple[bool, Optional[str]]:
@@ -122,14 +125,14 @@ class FileValidator:
             return False, "File too large (>100MB)"
         
         # Basic security scan for HTML/JS files
-        if path_obj.suffix.lower() in ['.html', '.htm', '.js']:
+        if path_obj.suffix.lower() in ['.html', '.htm', '.js', '.mjs']:
             try:
                 with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
                     content = f.read(10000)  # Read first 10KB for security scan
                     
-                for pattern in cls.SECURITY_PATTERNS:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        logger.warning(f"Potential security issue in {file_path}: {pattern}")
+                for regex in cls.SECURITY_REGEXES:
+                    if regex.search(content):
+                        logger.warning(f"Potential security issue in {file_path}: {regex.pattern}")
             except Exception:
                 pass  # Skip security scan if file can't be read
         
@@ -177,6 +180,8 @@ class FileValidator:
 class AWSValidator:
     """AWS-specific validation"""
     
+    BUCKET_NAME_REGEX = re.compile(r'^[a-z0-9.-]+$')
+    
     @staticmethod
     def validate_region(region: str) -> bool:
         """Validate AWS region"""
@@ -199,7 +204,7 @@ class AWSValidator:
             return False, "Bucket name must be 3-63 characters"
         
         # AWS bucket naming rules
-        if not re.match(r'^[a-z0-9.-]+$', bucket_name):
+        if not AWSValidator.BUCKET_NAME_REGEX.match(bucket_name):
             return False, "Bucket name can only contain lowercase letters, numbers, dots, and hyphens"
         
         if bucket_name.startswith('.') or bucket_name.endswith('.'):
@@ -263,6 +268,13 @@ class SecurityValidator:
         r'api_key\s*[=:]',
         r'private_key',
     ]
+    SENSITIVE_REGEXES = [re.compile(pattern, re.IGNORECASE) for pattern in SENSITIVE_PATTERNS]
+    
+    # Environment variable name fragments, e.g. 'password\s*[=:]' -> 'password'
+    SENSITIVE_ENV_NAMES = [
+        pattern.replace(r'\s*[=:]', '').replace('_', '').lower()
+        for pattern in SENSITIVE_PATTERNS
+    ]
     
     @classmethod
     def scan_file_for_secrets(cls, file_path: str) -> List[str]:
@@ -273,9 +285,8 @@ class SecurityValidator:
             with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
                 content = f.read()
                 
-            for pattern in cls.SENSITIVE_PATTERNS:
-                matches = re.finditer(pattern, content, re.IGNORECASE)
-                for match in matches:
+            for regex in cls.SENSITIVE_REGEXES:
+                for match in regex.finditer(content):
                     line_num = content[:match.start()].count('\n') + 1
                     issues.append(f"Potential secret at line {line_num}: {match.group()}")
         
@@ -290,8 +301,8 @@ class SecurityValidator:
         issues = []
         
         for key, value in os.environ.items():
-            if any(pattern.replace(r'\s*[=:]', '').replace('_', '').lower() in key.lower() 
-                   for pattern in cls.SENSITIVE_PATTERNS):
+            name = key.lower()
+            if any(fragment in name for fragment in cls.SENSITIVE_ENV_NAMES):
                 if value and len(value) > 10:  # Likely actual secret
                     issues.append(f"Potential secret in environment variable: {key}")
         
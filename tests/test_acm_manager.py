@@ -84,16 +84,58 @@ class TestACMManagerErrorHandling:
     def test_certificate_validation_timeout(self, mock_client):
         """Test certificate validation timeout"""
         mock_acm = MagicMock()
-        mock_acm.get_waiter.return_value.wait.side_effect = Exception("Timeout")
+        mock_acm.describe_certificate.return_value = {'Certificate': {'Status': 'PENDING_VALIDATION'}}
         mock_client.return_value = mock_acm
         
+        self.config.certificate_validation_timeout = 60
         manager = ACMManager(self.config)
         
-        # Should handle timeout gracefully
-        try:
-            manager.wait_for_certificate_validation("arn:aws:acm:cert")
-        except Exception:
-            pass  # Expected behavior
+        # Fake clock that only moves forward when the wait loop sleeps
+        clock = [0.0]
+        
+        def fake_sleep(seconds):
+            clock[0] += seconds
+        
+        with patch('awsup.managers.base.time.sleep', side_effect=fake_sleep) as mock_sleep, \
+             patch('awsup.managers.base.time.monotonic', side_effect=lambda: clock[0]):
+            assert manager.wait_for_certificate_validation("arn:aws:acm:cert") is False
+        
+        delays = [call[0][0] for call in mock_sleep.call_args_list]
+        assert delays[:3] == [5, 7.5, 11.25]
+        assert sum(delays) == pytest.approx(60)
+    
+    @patch('awsup.managers.base.time.sleep')
+    @patch('boto3.client')
+    def test_certificate_validation_terminal_failure(self, mock_client, mock_sleep):
+        """Test waiting stops as soon as the certificate can no longer be issued"""
+        mock_acm = MagicMock()
+        mock_acm.describe_certificate.side_effect = [
+            {'Certificate': {'Status': 'PENDING_VALIDATION'}},
+            {'Certificate': {'Status': 'VALIDATION_TIMED_OUT'}}
+        ]
+        mock_client.return_value = mock_acm
+        
+        manager = ACMManager(self.config)
+        
+        assert manager.wait_for_certificate_validation("arn:aws:acm:cert") is False
+        assert mock_acm.describe_certificate.call_count == 2
+        mock_sleep.assert_called_once_with(5)
+    
+    @patch('awsup.managers.base.time.sleep')
+    @patch('boto3.client')
+    def test_certificate_validation_survives_transient_error(self, mock_client, mock_sleep):
+        """Test a failed status lookup doesn't end the validation wait"""
+        mock_acm = MagicMock()
+        mock_acm.describe_certificate.side_effect = [
+            ConnectionError("connection reset"),
+            {'Certificate': {'Status': 'ISSUED'}}
+        ]
+        mock_client.return_value = mock_acm
+        
+        manager = ACMManager(self.config)
+        
+        assert manager.wait_for_certificate_validation("arn:aws:acm:cert") is True
+        assert mock_acm.describe_certificate.call_count == 2
     
     def test_invalid_certificate_arn(self):
         """Test handling of invalid certificate ARN"""
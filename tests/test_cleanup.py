@@ -6,7 +6,9 @@ import tempfile
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 from moto import mock_aws
+from click.testing import CliRunner
 
+from awsup.cli import cli
 from awsup.config import DeploymentConfig
 from awsup.production_deployer import CompleteProductionDeployer
 
@@ -81,16 +83,24 @@ class TestCleanupOperations:
                 }
                 deployer.state_manager.save_state(deployer.state)
                 
-                # Mock all cleanup operations
-                with patch.object(deployer.cloudfront_manager, 'delete_distribution') as mock_cf_delete, \
-                     patch.object(deployer.s3_manager, 'delete_bucket_and_contents') as mock_s3_delete, \
+                # Mock all cleanup operations, recording the deletion order
+                deleted = []
+                with patch.object(deployer.cloudfront_manager, 'delete_distribution',
+                                  side_effect=lambda _: deleted.append('distribution')) as mock_cf_delete, \
+                     patch.object(deployer.s3_manager, 'empty_bucket') as mock_s3_empty, \
+                     patch.object(deployer.s3_manager, 'delete_bucket_and_contents',
+                                  side_effect=lambda: deleted.append('bucket')) as mock_s3_delete, \
                      patch.object(deployer.acm_manager, 'delete_certificate') as mock_acm_delete:
                     
                     deployer.cleanup_phase2()
                     
                     # Verify all deletions were called
                     mock_cf_delete.assert_called_once_with('E123456789ABCDEF')
+                    mock_s3_empty.assert_called_once()
                     mock_s3_delete.assert_called_once()
+                    
+                    # The bucket is the distribution's origin, so it goes last
+                    assert deleted == ['distribution', 'bucket']
                     mock_acm_delete.assert_called_once_with('arn:aws:acm:us-east-1:123456789012:certificate/abc123')
                     
                     # Verify Phase 2 state was cleared
@@ -102,6 +112,42 @@ class TestCleanupOperations:
             finally:
                 os.chdir(original_cwd)
     
+    @patch('awsup.config.AWSCredentialValidator.get_account_id')
+    def test_cleanup_phase2_distribution_failure(self, mock_get_account):
+        """Test the bucket survives when the distribution using it can't be deleted"""
+        mock_get_account.return_value = "123456789012"
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            original_cwd = Path.cwd()
+            try:
+                import os
+                os.chdir(temp_dir)
+                
+                deployer = CompleteProductionDeployer(self.config)
+                deployer.state = {
+                    'bucket_name': 'example.com',
+                    'distribution_id': 'E123456789ABCDEF',
+                    'phase2_complete': True
+                }
+                
+                deployer.state_manager.save_state(deployer.state)
+                
+                with patch.object(deployer.cloudfront_manager, 'delete_distribution',
+                                  side_effect=Exception("DistributionNotDisabled")), \
+                     patch.object(deployer.s3_manager, 'empty_bucket'), \
+                     patch.object(deployer.s3_manager, 'delete_bucket_and_contents') as mock_s3_delete:
+                    
+                    with pytest.raises(Exception, match="DistributionNotDisabled"):
+                        deployer.cleanup_phase2()
+                    
+                    mock_s3_delete.assert_not_called()
+                    saved_state = deployer.state_manager.load_state()
+                    assert saved_state['bucket_name'] == 'example.com'
+                    assert saved_state['distribution_id'] == 'E123456789ABCDEF'
+                
+            finally:
+                os.chdir(original_cwd)
+    
     @patch('awsup.config.AWSCredentialValidator.get_account_id')
     @patch('awsup.config.AWSCredentialValidator.validate_credentials')
     def test_cleanup_all(self, mock_validate_creds, mock_get_account):
@@ -241,5 +287,40 @@ class TestResourceValidation:
             assert summary is not None
 
 
+class TestCleanupCommand:
+    """Test the cleanup CLI command"""
+    
+    @patch('awsup.cli.ProductionDeployer')
+    def test_cleanup_yes_skips_prompt(self, mock_deployer_cls):
+        """Test --yes runs cleanup without prompting"""
+        result = CliRunner().invoke(cli, ['cleanup', 'example.com', '--yes'])
+        
+        assert result.exit_code == 0
+        deployer = mock_deployer_cls.return_value.deployer
+        assert 'Continue?' not in result.output
+        deployer.cleanup_all.assert_called_once()
+    
+    @patch('awsup.cli.ProductionDeployer')
+    def test_cleanup_declined(self, mock_deployer_cls):
+        """Test declining the prompt deletes nothing"""
+        result = CliRunner().invoke(cli, ['cleanup', 'example.com'], input='n\n')
+        
+        assert result.exit_code == 1
+        assert 'Cleanup failed' not in result.output
+        deployer = mock_deployer_cls.return_value.deployer
+        deployer.cleanup_all.assert_not_called()
+        deployer.cleanup_phase2.assert_not_called()
+    
+    @patch('awsup.cli.ProductionDeployer')
+    def test_cleanup_prefetches_while_prompting(self, mock_deployer_cls):
+        """Test the read-only bucket listing starts before cleanup is confirmed"""
+        result = CliRunner().invoke(cli, ['cleanup', 'example.com', '--phase', '2'], input='y\n')
+        
+        assert result.exit_code == 0
+        deployer = mock_deployer_cls.return_value.deployer
+        deployer.prefetch_cleanup.assert_called_once()
+        deployer.cleanup_phase2.assert_called_once()
+
+
 if __name__ == "__main__":
-    pytest.main([__file__])
\ No newline at end of file
+    pytest.main([__file__])
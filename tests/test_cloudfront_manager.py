@@ -34,6 +34,19 @@ class TestCloudFrontManager:
         assert 'domain' in distribution_info
         assert distribution_info['domain'].endswith('.cloudfront.net')
     
+    def test_create_distribution_tags_without_sts(self):
+        """Test tagging a new distribution reuses the caller's account ID"""
+        with patch.object(self.manager, '_get_account_id') as mock_get_account, \
+             patch.object(self.manager.client, 'tag_resource') as mock_tag:
+            distribution_info = self.manager.create_or_update_distribution(
+                "example.com", "arn:aws:acm:us-east-1:123456789012:certificate/test", "123456789012"
+            )
+        
+        mock_get_account.assert_not_called()
+        assert mock_tag.call_args[1]['Resource'] == (
+            f"arn:aws:cloudfront::123456789012:distribution/{distribution_info['id']}"
+        )
+    
     def test_get_distribution_status(self):
         """Test distribution status checking"""
         # Create distribution first
@@ -48,17 +61,18 @@ class TestCloudFrontManager:
         status = self.manager.get_distribution_status(distribution_id)
         assert status in ['InProgress', 'Deployed']
     
-    @patch('awsup.managers.cloudfront.time.sleep')
+    @patch('awsup.managers.base.time.sleep')
     def test_wait_for_distribution(self, mock_sleep):
         """Test waiting for distribution deployment"""
         distribution_id = "E123456789ABCDEF"
         
-        # Mock the waiter
-        with patch.object(self.manager.client, 'get_waiter') as mock_waiter:
-            mock_waiter.return_value.wait.return_value = None
+        # Poll until the distribution reports Deployed
+        with patch.object(self.manager, 'get_distribution_status') as mock_status:
+            mock_status.side_effect = ['InProgress', 'InProgress', 'Deployed']
             
-            self.manager.wait_for_distribution_deployed(distribution_id, timeout=10)
-            mock_waiter.assert_called_once_with('distribution_deployed')
+            self.manager.wait_for_distribution_deployed(distribution_id, timeout=600)
+            assert mock_status.call_count == 3
+            assert mock_sleep.call_count == 2
     
     def test_create_invalidation(self):
         """Test cache invalidation creation"""
@@ -79,6 +93,20 @@ class TestCloudFrontManager:
             assert call_args['DistributionId'] == distribution_id
             assert call_args['InvalidationBatch']['Paths']['Items'] == paths
     
+    def test_invalidation_caller_reference_unique(self):
+        """Test back-to-back invalidations aren't deduplicated by CloudFront"""
+        with patch.object(self.manager.client, 'create_invalidation') as mock_invalidate:
+            mock_invalidate.return_value = {'Invalidation': {'Id': 'I123456789ABCDEF'}}
+            
+            self.manager.create_invalidation("E123456789ABCDEF")
+            self.manager.create_invalidation("E123456789ABCDEF")
+            
+            references = {
+                call[1]['InvalidationBatch']['CallerReference']
+                for call in mock_invalidate.call_args_list
+            }
+            assert len(references) == 2
+    
     def test_delete_distribution(self):
         """Test distribution deletion"""
         distribution_id = "E123456789ABCDEF"
@@ -196,6 +224,15 @@ class TestCloudFrontConfiguration:
         assert config['ViewerCertificate']['ACMCertificateArn'] == certificate_arn
         assert config['ViewerCertificate']['SSLSupportMethod'] == 'sni-only'
     
+    def test_invalidation_paths(self):
+        """Test invalidation paths for changed files"""
+        paths = self.manager.invalidation_paths(['index.html', 'css/site style.css'])
+        assert paths == ['/', '/css/site%20style.css', '/index.html']
+        
+        # Large change sets collapse to a single wildcard
+        keys = [f'assets/{i}.js' for i in range(500)]
+        assert self.manager.invalidation_paths(keys) == ['/*']
+    
     def test_security_headers_configuration(self):
         """Test security headers in distribution config"""
         bucket_name = "example.com"
@@ -60,6 +60,13 @@ class TestDeploymentConfig:
         with pytest.raises(ValueError, match="Invalid region"):
             config.validate()
     
+    def test_config_validation_invalid_concurrency(self):
+        """Test validation with invalid upload concurrency"""
+        config = DeploymentConfig(domain="example.com", upload_concurrency=0)
+        
+        with pytest.raises(ValueError, match="Invalid upload concurrency"):
+            config.validate()
+    
     def test_config_to_file(self):
         """Test saving configuration to file"""
         config = DeploymentConfig(domain="example.com")
@@ -113,6 +120,10 @@ class TestDeploymentConfig:
 class TestAWSCredentialValidator:
     """Test AWS credential validation"""
     
+    def setup_method(self):
+        """Start every test without a cached caller identity"""
+        AWSCredentialValidator.clear_cache()
+    
     @patch('boto3.client')
     def test_validate_credentials_success(self, mock_client):
         """Test successful credential validation"""
@@ -149,6 +160,23 @@ class TestAWSCredentialValidator:
         account_id = AWSCredentialValidator.get_account_id()
         assert account_id is None
     
+    @patch('boto3.client')
+    def test_caller_identity_cached(self, mock_client):
+        """Test repeated identity lookups share one STS call"""
+        mock_sts = MagicMock()
+        mock_sts.get_caller_identity.return_value = {'Account': '123456789012'}
+        mock_client.return_value = mock_sts
+        
+        assert AWSCredentialValidator.validate_credentials() is True
+        assert AWSCredentialValidator.get_account_id() == '123456789012'
+        assert mock_sts.get_caller_identity.call_count == 1
+        
+        # Failed lookups are not cached
+        AWSCredentialValidator.clear_cache()
+        mock_sts.get_caller_identity.side_effect = [Exception("Expired token"), {'Account': '123456789012'}]
+        assert AWSCredentialValidator.get_account_id() is None
+        assert AWSCredentialValidator.get_account_id() == '123456789012'
+    
     @patch('boto3.client')
     def test_validate_permissions(self, mock_client):
         """Test permission validation"""
@@ -39,6 +39,19 @@ class TestDeploymentWorkflow:
         assert deployer.acm_manager is not None
         assert deployer.cloudfront_manager is not None
     
+    @patch('boto3.client')
+    @patch('awsup.config.AWSCredentialValidator.get_account_id')
+    def test_managers_created_on_first_use(self, mock_get_account, mock_client):
+        """Test the deployer only creates clients for the services it touches"""
+        mock_get_account.return_value = "123456789012"
+        
+        deployer = CompleteProductionDeployer(self.config)
+        mock_client.assert_not_called()
+        
+        route53_manager = deployer.route53_manager
+        assert deployer.route53_manager is route53_manager
+        assert [call[0][0] for call in mock_client.call_args_list] == ['route53']
+    
     @patch('awsup.config.AWSCredentialValidator.get_account_id')
     @patch('awsup.config.AWSCredentialValidator.validate_credentials')
     @patch('awsup.config.AWSCredentialValidator.validate_permissions')
@@ -79,6 +92,40 @@ class TestDeploymentWorkflow:
         
         assert result is False
     
+    @patch('awsup.config.AWSCredentialValidator.get_account_id')
+    def test_phase2_invalidates_changed_files(self, mock_get_account):
+        """Test re-deploying to an existing distribution invalidates uploaded paths"""
+        mock_get_account.return_value = "123456789012"
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            original_cwd = Path.cwd()
+            try:
+                import os
+                os.chdir(temp_dir)
+                
+                deployer = CompleteProductionDeployer(self.config)
+                deployer.state = {'hosted_zone_id': '/hostedzone/Z123456789', 'phase1_complete': True}
+                deployer.s3_manager.uploaded_keys = ['index.html']
+                
+                with patch.object(deployer.acm_manager, 'request_or_get_certificate', return_value='arn:cert'), \
+                     patch.object(deployer.acm_manager, 'wait_for_certificate_validation', return_value=True), \
+                     patch.object(deployer.s3_manager, 'create_or_get_bucket', return_value='test-example.com'), \
+                     patch.object(deployer.s3_manager, 'upload_website_files', return_value=1), \
+                     patch.object(deployer.s3_manager, 'update_bucket_policy'), \
+                     patch.object(deployer.route53_manager, 'create_alias_records'), \
+                     patch.object(deployer.cloudfront_manager, 'create_or_update_distribution') as mock_dist, \
+                     patch.object(deployer.cloudfront_manager, 'create_invalidation') as mock_invalidate:
+                    
+                    mock_dist.return_value = {'id': 'E123', 'domain': 'd123.cloudfront.net', 'action': 'updated'}
+                    
+                    results = deployer.deploy_phase2()
+                    
+                    assert results['distribution_id'] == 'E123'
+                    mock_invalidate.assert_called_once_with('E123', ['/', '/index.html'])
+                
+            finally:
+                os.chdir(original_cwd)
+    
     def test_invalid_domain_config(self):
         """Test deployer with invalid domain configuration"""
         invalid_config = DeploymentConfig(domain="invalid")
@@ -180,6 +227,28 @@ class TestErrorRecovery:
         assert result is None  # Empty list means no hosted zone found
         assert mock_route53.list_hosted_zones_by_name.call_count == 3
     
+    @patch('boto3.client')
+    def test_clients_use_adaptive_retries(self, mock_client):
+        """Test managers create clients with the shared retry and pool settings"""
+        from awsup.managers.s3 import S3Manager
+        manager = S3Manager(self.config)
+        
+        client_config = mock_client.call_args[1]['config']
+        assert client_config is manager.client_config
+        assert client_config.retries == {'mode': 'adaptive', 'max_attempts': 10}
+        assert client_config.max_pool_connections >= self.config.upload_concurrency
+    
+    @patch('boto3.client')
+    def test_credentials_resolved_before_first_request(self, mock_client):
+        """Test managers resolve credentials once when they are created"""
+        from awsup.managers.s3 import S3Manager
+        session = MagicMock()
+        
+        with patch('boto3.DEFAULT_SESSION', session):
+            S3Manager(self.config)
+        
+        session.get_credentials.return_value.get_frozen_credentials.assert_called_once()
+    
     def test_partial_deployment_recovery(self):
         """Test recovery from partial deployment"""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -67,7 +67,7 @@ class TestRoute53Manager:
         # For moto, we just verify no exceptions were raised
         assert True
     
-    @patch('awsup.managers.route53.time.sleep')
+    @patch('awsup.managers.base.time.sleep')
     def test_retry_with_backoff(self, mock_sleep):
         """Test retry mechanism"""
         # Test successful operation after retries
@@ -83,6 +83,193 @@ class TestS3Manager:
             assert 'style.css' in uploaded_keys
             assert 'script.js' in uploaded_keys
     
+    def test_upload_directory_concurrently(self):
+        """Test parallel upload of a nested directory"""
+        bucket_name = self.manager.create_or_get_bucket()
+        self.config.upload_concurrency = 4
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            (Path(temp_dir) / 'index.html').write_text("<!DOCTYPE html><html><body>Home</body></html>")
+            (Path(temp_dir) / 'assets').mkdir()
+            for i in range(20):
+                (Path(temp_dir) / 'assets' / f'file{i}.css').write_text(f"body {{ z-index: {i}; }}")
+            
+            count = self.manager.upload_website_files(temp_dir)
+            assert count == 21
+            
+            response = self.s3_client.list_objects_v2(Bucket=bucket_name)
+            uploaded_keys = {obj['Key'] for obj in response['Contents']}
+            assert uploaded_keys == {'index.html'} | {f'assets/file{i}.css' for i in range(20)}
+    
+    def test_upload_progress_logged_in_batches(self):
+        """Test directory uploads log batched progress instead of one line per file"""
+        self.manager.create_or_get_bucket()
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            (Path(temp_dir) / 'index.html').write_text("<!DOCTYPE html><html><body>Home</body></html>")
+            for i in range(119):
+                (Path(temp_dir) / f'page{i}.txt').write_text(f"page {i}")
+            
+            with patch('awsup.managers.s3.PROGRESS_INTERVAL', 3600), \
+                 patch.object(self.manager.logger, 'info') as mock_info:
+                assert self.manager.upload_website_files(temp_dir) == 120
+            
+            messages = [call[0][0] for call in mock_info.call_args_list]
+            assert [m for m in messages if m.startswith('Processed')] == [
+                'Processed 50/120 files (50 uploaded)',
+                'Processed 100/120 files (100 uploaded)'
+            ]
+            assert not any(m.startswith('Uploaded: ') for m in messages)
+            assert messages[-1] == 'Uploaded 120 files successfully'
+    
+    def test_upload_large_file_multipart(self):
+        """Test files above the multipart threshold are uploaded in parts"""
+        bucket_name = self.manager.create_or_get_bucket()
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            (Path(temp_dir) / 'index.html').write_text("<!DOCTYPE html><html><body>Home</body></html>")
+            (Path(temp_dir) / 'brochure.pdf').write_bytes(b'%PDF' * (3 * 1024 * 1024))  # 12 MB
+            
+            count = self.manager.upload_website_files(temp_dir)
+            assert count == 2
+            
+            response = self.s3_client.head_object(Bucket=bucket_name, Key='brochure.pdf')
+            assert response['ContentLength'] == 12 * 1024 * 1024
+            assert response['ContentType'] == 'application/pdf'
+            assert '-' in response['ETag']  # Multipart ETags carry a part count suffix
+    
+    def test_part_concurrency_fits_connection_pool(self):
+        """Test file workers x part uploads never exceed the client connection pool"""
+        for concurrency in [1, 4, 16, 32, 64]:
+            self.config.upload_concurrency = concurrency
+            manager = S3Manager(self.config)
+            
+            parts = manager.transfer_config.max_concurrency
+            assert parts >= 1
+            assert concurrency * parts <= manager.client_config.max_pool_connections
+    
+    def test_upload_small_file_single_put(self):
+        """Test small files are sent with one PutObject call and keep their headers"""
+        bucket_name = self.manager.create_or_get_bucket()
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            (Path(temp_dir) / 'index.html').write_text("<!DOCTYPE html><html><body>Home</body></html>")
+            (Path(temp_dir) / 'style.css').write_text("body { margin: 0; }")
+            
+            with patch.object(self.manager.client, 'upload_file') as mock_upload_file:
+                count = self.manager.upload_website_files(temp_dir)
+            
+            assert count == 2
+            mock_upload_file.assert_not_called()
+            
+            response = self.s3_client.head_object(Bucket=bucket_name, Key='style.css')
+            assert response['ContentType'] == 'text/css'
+            assert response['CacheControl'] == 'public, max-age=31536000'
+    
+    def test_upload_compresses_text_assets(self):
+        """Test text assets are stored gzip-compressed and binary assets are not"""
+        import gzip
+        bucket_name = self.manager.create_or_get_bucket()
+        self.config.compress_text_assets = True
+        css = "body { margin: 0; padding: 0; }\n" * 100
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            (Path(temp_dir) / 'index.html').write_text("<!DOCTYPE html><html><body>Home</body></html>")
+            (Path(temp_dir) / 'style.css').write_text(css)
+            (Path(temp_dir) / 'logo.png').write_bytes(b'\x89PNG' * 1000)
+            
+            assert self.manager.upload_website_files(temp_dir) == 3
+            
+            response = self.s3_client.get_object(Bucket=bucket_name, Key='style.css')
+            assert response['ContentEncoding'] == 'gzip'
+            assert response['ContentType'] == 'text/css'
+            assert gzip.decompress(response['Body'].read()).decode() == css
+            
+            response = self.s3_client.head_object(Bucket=bucket_name, Key='logo.png')
+            assert 'ContentEncoding' not in response
+            
+            # Compressed output is deterministic, so a re-deploy is still a no-op
+            assert self.manager.upload_website_files(temp_dir) == 0
+    
+    def test_upload_uncompressed_by_default(self):
+        """Test text assets are stored as-is by default"""
+        bucket_name = self.manager.create_or_get_bucket()
+        css = "body { margin: 0; padding: 0; }\n" * 100
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            (Path(temp_dir) / 'index.html').write_text("<!DOCTYPE html><html><body>Home</body></html>")
+            (Path(temp_dir) / 'style.css').write_text(css)
+            
+            self.manager.upload_website_files(temp_dir)
+            
+            response = self.s3_client.get_object(Bucket=bucket_name, Key='style.css')
+            assert 'ContentEncoding' not in response
+            assert response['Body'].read().decode() == css
+    
+    def test_upload_skips_unchanged_files(self):
+        """Test re-deploying only uploads files whose content changed"""
+        self.manager.create_or_get_bucket()
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            (Path(temp_dir) / 'index.html').write_text("<!DOCTYPE html><html><body>Home</body></html>")
+            (Path(temp_dir) / 'style.css').write_text("body { margin: 0; }")
+            
+            assert self.manager.upload_website_files(temp_dir) == 2
+            assert self.manager.upload_website_files(temp_dir) == 0
+            assert self.manager.uploaded_keys == []
+            
+            (Path(temp_dir) / 'style.css').write_text("body { margin: 1px; }")  # Same size, new content
+            assert self.manager.upload_website_files(temp_dir) == 1
+            assert self.manager.uploaded_keys == ['style.css']
+    
+    def test_forced_upload_replaces_stale_headers(self):
+        """Test disabling the skip (--force) re-uploads unchanged bytes with current headers"""
+        bucket_name = self.manager.create_or_get_bucket()
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            (Path(temp_dir) / 'index.html').write_text("<!DOCTYPE html><html><body>Home</body></html>")
+            (Path(temp_dir) / 'app.wasm').write_bytes(b'\x00asm\x01\x00\x00\x00')
+            
+            # Same bytes as the local file, uploaded before .wasm had a content type
+            self.s3_client.put_object(
+                Bucket=bucket_name, Key='app.wasm', Body=b'\x00asm\x01\x00\x00\x00',
+                ContentType='application/octet-stream', CacheControl='public, max-age=86400'
+            )
+            
+            self.manager.upload_website_files(temp_dir)
+            assert 'app.wasm' not in self.manager.uploaded_keys
+            
+            self.config.skip_unchanged_files = False
+            self.manager.upload_website_files(temp_dir)
+            assert 'app.wasm' in self.manager.uploaded_keys
+            
+            response = self.s3_client.head_object(Bucket=bucket_name, Key='app.wasm')
+            assert response['ContentType'] == 'application/wasm'
+    
+    def test_upload_without_skipping_unchanged_files(self):
+        """Test unchanged files are re-uploaded when skipping is disabled"""
+        self.manager.create_or_get_bucket()
+        self.config.skip_unchanged_files = False
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            (Path(temp_dir) / 'index.html').write_text("<!DOCTYPE html><html><body>Home</body></html>")
+            
+            assert self.manager.upload_website_files(temp_dir) == 1
+            assert self.manager.upload_website_files(temp_dir) == 1
+    
+    def test_iter_files_skips_hidden_files(self):
+        """Test directory walk yields nested files and skips hidden ones"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            (root / 'index.html').write_text("<html></html>")
+            (root / '.env').write_text("SECRET=1")
+            (root / 'css' / 'vendor').mkdir(parents=True)
+            (root / 'css' / 'vendor' / 'reset.css').write_text("* { margin: 0; }")
+            (root / 'css' / '.DS_Store').write_text("")
+            
+            keys = {s3_key for _, s3_key in self.manager._iter_files(root)}
+            assert keys == {'index.html', 'css/vendor/reset.css'}
+    
     def test_upload_default_page(self):
         """Test uploading default landing page when no path provided"""
         # Create bucket first
@@ -117,6 +304,12 @@ class TestS3Manager:
             ('.jpg', 'image/jpeg'),
             ('.png', 'image/png'),
             ('.pdf', 'application/pdf'),
+            ('.mp4', 'video/mp4'),  # Falls back to mimetypes
+            ('.wasm', 'application/wasm'),
+            ('.webp', 'image/webp'),
+            ('.avif', 'image/avif'),
+            ('.map', 'application/json'),
+            ('.WOFF2', 'font/woff2'),
             ('.unknown', 'application/octet-stream')
         ]
         
@@ -163,6 +356,20 @@ class TestS3Manager:
         except Exception:
             # moto might not fully support bucket policies
             pass
+    
+    def test_delete_versioned_bucket(self):
+        """Test deleting a bucket holding object versions and delete markers"""
+        bucket_name = self.manager.create_or_get_bucket()
+        
+        for i in range(3):
+            self.s3_client.put_object(Bucket=bucket_name, Key='index.html', Body=f'v{i}')
+        self.s3_client.put_object(Bucket=bucket_name, Key='old.html', Body='old')
+        self.s3_client.delete_object(Bucket=bucket_name, Key='old.html')  # Leaves a delete marker
+        
+        self.manager.delete_bucket_and_contents()
+        
+        response = self.s3_client.list_buckets()
+        assert bucket_name not in [b['Name'] for b in response['Buckets']]
 
 
 class TestS3ManagerErrorHandling:
@@ -185,6 +392,74 @@ class TestS3ManagerErrorHandling:
         with pytest.raises(Exception):
             manager.create_or_get_bucket()
     
+    @patch('boto3.client')
+    def test_delete_objects_partial_failure(self, mock_client):
+        """Test per-key DeleteObjects errors are surfaced"""
+        mock_s3 = MagicMock()
+        mock_s3.delete_objects.return_value = {
+            'Errors': [{'Key': 'index.html', 'Code': 'AccessDenied', 'Message': 'Access Denied'}]
+        }
+        mock_client.return_value = mock_s3
+        
+        manager = S3Manager(self.config)
+        
+        with pytest.raises(ValueError, match="Failed to delete 1 objects"):
+            manager._delete_objects_batch([{'Key': 'index.html', 'VersionId': 'v1'}])
+    
+    @patch('boto3.client')
+    def test_delete_bucket_batches_large_listing(self, mock_client):
+        """Test every version across pages is deleted in batches of exactly 1000"""
+        # MaxKeys caps versions and delete markers combined at 1000 per page
+        page_sizes = [(700, 300), (700, 300), (700, 300), (500, 300)]
+        pages = [
+            {
+                'Versions': [{'Key': f'p{p}/v{i}', 'VersionId': '1'} for i in range(versions)],
+                'DeleteMarkers': [{'Key': f'p{p}/m{i}', 'VersionId': '2'} for i in range(markers)]
+            }
+            for p, (versions, markers) in enumerate(page_sizes)
+        ]
+        mock_s3 = MagicMock()
+        mock_s3.get_paginator.return_value.paginate.return_value = pages
+        mock_s3.delete_objects.return_value = {}
+        mock_client.return_value = mock_s3
+        
+        manager = S3Manager(self.config)
+        manager.delete_bucket_and_contents()
+        
+        batches = [call[1]['Delete']['Objects'] for call in mock_s3.delete_objects.call_args_list]
+        assert all(len(batch) <= 1000 for batch in batches)
+        assert sum(len(batch) for batch in batches) == 3800
+        assert sorted(len(batch) for batch in batches) == [800, 1000, 1000, 1000]
+        mock_s3.delete_bucket.assert_called_once_with(Bucket="example.com")
+    
+    @patch('boto3.client')
+    def test_empty_bucket_uses_prefetched_listing(self, mock_client):
+        """Test a prefetched first page is reused, listing resumes after it, and the bucket is kept"""
+        mock_s3 = MagicMock()
+        mock_s3.list_object_versions.return_value = {
+            'Versions': [{'Key': f'a{i}', 'VersionId': '1'} for i in range(1000)],
+            'IsTruncated': True,
+            'NextKeyMarker': 'a999',
+            'NextVersionIdMarker': '1'
+        }
+        mock_s3.get_paginator.return_value.paginate.return_value = [
+            {'Versions': [{'Key': f'b{i}', 'VersionId': '1'} for i in range(10)]}
+        ]
+        mock_s3.delete_objects.return_value = {}
+        mock_client.return_value = mock_s3
+        
+        manager = S3Manager(self.config)
+        manager.prefetch_object_versions()
+        manager.empty_bucket()
+        
+        mock_s3.list_object_versions.assert_called_once_with(Bucket="example.com")
+        mock_s3.get_paginator.return_value.paginate.assert_called_once_with(
+            Bucket="example.com", KeyMarker='a999', VersionIdMarker='1'
+        )
+        batches = [call[1]['Delete']['Objects'] for call in mock_s3.delete_objects.call_args_list]
+        assert sum(len(batch) for batch in batches) == 1010
+        mock_s3.delete_bucket.assert_not_called()
+    
     def test_invalid_website_path(self):
         """Test invalid website path handling"""
         manager = S3Manager(self.config)
@@ -76,6 +76,19 @@ class TestFileValidator:
         finally:
             Path(temp_file).unlink()
     
+    def test_modern_web_assets_allowed(self):
+        """Test build output such as WebAssembly and source maps is accepted"""
+        for suffix in ['.wasm', '.map', '.avif', '.webmanifest']:
+            with tempfile.NamedTemporaryFile(mode='wb', suffix=suffix, delete=False) as f:
+                f.write(b'\x00asm')
+                temp_file = f.name
+            
+            try:
+                is_valid, error = FileValidator.validate_file(temp_file)
+                assert is_valid, f"{suffix} files should pass validation: {error}"
+            finally:
+                Path(temp_file).unlink()
+    
     def test_validate_large_file(self):
         """Test large file rejection"""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f: